@@ -190,10 +190,9 @@ def _main(
 
     # Validate sample files
     # FIXME: Make validation configurable
-    for sample in samples:
-        if sample not in samples.with_files:
-            logger.warning(f"Sample {sample} will be skipped as it has no files")
-            sample.fail("Missing files")
+    for sample in samples.without_files:
+        logger.warning(f"Sample {sample} will be skipped as it has no files")
+        sample.fail("Missing files")
 
     # Start runners for unprocessed samples and mergeback failed samples after
     samples = start_runners(
@@ -3,16 +3,27 @@
 import json
 import re
 from ast import literal_eval
+from collections import deque
 from contextlib import suppress
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Literal, Mapping, MutableMapping, Type, get_args, overload
+from typing import (
+    Any,
+    Iterator,
+    Literal,
+    Mapping,
+    MutableMapping,
+    Type,
+    get_args,
+    overload,
+)
 
 import rich_click as click
 from humanfriendly import format_size, parse_size
 from jsonschema._format import draft7_format_checker
 from jsonschema.exceptions import FormatError
 
-from cellophane.src import data, util
+from cellophane.src import data
 
 ITEMS_TYPES = Literal[
     "string",
@@ -68,13 +79,18 @@ class InvertibleParamType(click.ParamType):
         raise NotImplementedError
 
 
+# Characters a Python literal can start with (after whitespace). Values starting
+# with anything else are plain strings, so literal_eval can be skipped.
+_LITERAL_STARTS = frozenset("0123456789+-.([{'\"#\\TFNbBrRuU")
+
+
 class StringMapping(InvertibleParamType):
     """Represents a click parameter type for comma-separated mappings.
 
     Attributes:
     ----------
         name (str): The name of the parameter type.
-        scanner (re.Scanner): The regular expression scanner used for parsing mappings.
+        token_pattern (re.Pattern): The regular expression used for tokenizing.
 
     Methods:
     -------
@@ -114,16 +130,38 @@ class StringMapping(InvertibleParamType):
     """
 
     name = "mapping"
-    scanner = re.Scanner(  # type: ignore[attr-defined]
-        [
-            (r'"[^"]*"', lambda _, token: token[1:-1]),
-            (r"'[^']*'", lambda _, token: token[1:-1]),
-            (r"[\w.]+(?==)", lambda _, token: token.strip()),
-            (r"(?<==)[^,]+", lambda _, token: token.strip()),
-            (r"\s*[=,]\s*", lambda *_: None),
-        ],
+    token_pattern = re.compile(
+        r'(?P<quoted>"[^"]*"'
+        r"|'[^']*')"
+        r"|(?P<key>[\w.]+(?==))"
+        r"|(?P<value>(?<==)[^,]+)"
+        r"|\s*[=,]\s*",
     )
 
+    def scan(self, value: str) -> tuple[list[str], str]:
+        """Split a mapping string into its key and value tokens.
+
+        Args:
+        ----
+            value (str): The string to be split.
+
+        Returns:
+        -------
+            tuple[list[str], str]: The tokens, and the part of the string that
+                could not be tokenized.
+
+        """
+        tokens: list[str] = []
+        pos = 0
+        while (token := self.token_pattern.match(value, pos)) and token.end() > pos:
+            match token.lastgroup:
+                case "quoted":
+                    tokens.append(token[0][1:-1])
+                case "key" | "value":
+                    tokens.append(token[0].strip())
+            pos = token.end()
+        return tokens, value[pos:]
+
     def convert(
         self,
         value: str | MutableMapping,
@@ -168,28 +206,33 @@ class StringMapping(InvertibleParamType):
             return data.PreservedDict(value)
 
         try:
-            tokens, extra = self.scanner.scan(value)
+            tokens, extra = self.scan(value)
             if extra or len(tokens) % 2 != 0:
                 raise ValueError
-            parsed = data.PreservedDict(zip(tokens[::2], tokens[1::2]))
+            # Pair up consecutive key and value tokens without slicing
+            pairs = iter(tokens)
+            parsed = data.PreservedDict(zip(pairs, pairs))
         except Exception:  # pylint: disable=broad-except
             self.fail(
                 f"Expected a comma separated mapping (a=b,x=y), got {value}", param, ctx,
             )
 
         for k, v in parsed.items():
+            if v.lstrip()[:1] not in _LITERAL_STARTS:
+                continue
             with suppress(Exception):
                 parsed[k] = literal_eval(v)
-        while True:
-            try:
-                key: str = next(k for k in parsed if "." in k)
-                parts = key.rsplit(".", maxsplit=1)
-                if (subkey := parts[0]) in parsed:
-                    parsed[subkey] |= {parts[1]: parsed.pop(key)}
-                else:
-                    parsed[subkey] = {parts[1]: parsed.pop(key)}
-            except StopIteration:
-                break
+        # Nest dotted keys (a.b=1 -> {"a": {"b": 1}}), innermost level first
+        pending = deque(k for k in parsed if "." in k)
+        while pending:
+            key: str = pending.popleft()
+            subkey, _, leaf = key.rpartition(".")
+            if subkey in parsed:
+                parsed[subkey] |= {leaf: parsed.pop(key)}
+            else:
+                parsed[subkey] = {leaf: parsed.pop(key)}
+                if "." in subkey:
+                    pending.append(subkey)
 
         return data.PreservedDict(parsed)
 
@@ -205,13 +248,21 @@ class StringMapping(InvertibleParamType):
             str: The inverted value.
 
         """
-        _container = data.Container(value)
-        _keys = util.map_nested_keys(value)
-        _nodes: list[str] = [
-            f"{'.'.join(k)}={json.dumps(_container[k])}" for k in _keys
-        ]
+        return ",".join(
+            f"{'.'.join(k)}={json.dumps(v)}" for k, v in _walk(value) if k
+        )
 
-        return ",".join(_nodes)
+
+def _walk(
+    node: Any,
+    path: tuple[str, ...] = (),
+) -> Iterator[tuple[tuple[str, ...], Any]]:
+    # Same traversal as util.map_nested_keys, but yields the leaf values as well
+    if not isinstance(node, dict) or len(node) == 0:
+        yield path, node
+        return
+    for key, child in node.items():
+        yield from _walk(child, (*path, key))
 
 
 class TypedArray(click.ParamType):
@@ -248,8 +299,8 @@ class TypedArray(click.ParamType):
     name = "array"
     items_type: ITEMS_TYPES | None = None
     items_format: FORMATS | None = None
-    items_minimum: int | float | None = None
-    items_maximum: int | float | None = None
+    items_min: int | float | None = None
+    items_max: int | float | None = None
 
     def __init__(
         self,
@@ -265,6 +316,12 @@ class TypedArray(click.ParamType):
         self.items_format = items_format
         self.items_min = items_min
         self.items_max = items_max
+        self._items_click_type = click_type(
+            self.items_type,
+            format_=self.items_format,
+            min_=self.items_min,
+            max_=self.items_max,
+        )
 
     def convert(  # type: ignore[override]
         self,
@@ -296,17 +353,12 @@ class TypedArray(click.ParamType):
 
         """
         try:
-            value_ = [*value] if isinstance(value, (list, tuple)) else [value]
-            type_ = click_type(
-                self.items_type,
-                format_=self.items_format,
-                min_=self.items_minimum,
-                max_=self.items_maximum,
-            )
+            value_ = value if isinstance(value, (list, tuple)) else (value,)
+            type_ = self._items_click_type
             if isinstance(type_, click.ParamType):
-                return [type_.convert(v, param, ctx) for v in value_ or ()]
-            else:
-                return [type_(v) for v in value_ or ()]
+                convert = type_.convert
+                return [convert(v, param, ctx) for v in value_]
+            return [type_(v) for v in value_]
         except Exception as exc:  # pylint: disable=broad-except
             self.fail(str(exc), param, ctx)
 
@@ -315,6 +367,27 @@ class TypedArray(click.ParamType):
         return f"{self.name.upper()}[{self.items_type}]"
 
 
+# Plain sizes like "100", "1.5G", "4 GiB" or "10kb" are parsed here directly.
+# Anything else goes through humanfriendly, which also produces the errors.
+_SIZE_RE = re.compile(
+    r"\s*(\d+(?:\.\d+)?)\s*(?:([kmgtpezy])(ib|b)?|b?)\s*",
+    re.IGNORECASE | re.ASCII,
+)
+_SIZE_EXPONENTS = {p: e for e, p in enumerate("kmgtpezy", start=1)}
+
+
+def _parse_size(value: str) -> int:
+    if (match := _SIZE_RE.fullmatch(value)) is None:
+        return parse_size(value)
+    number_, prefix, suffix = match.groups()
+    number = float(number_) if "." in number_ else int(number_)
+    if prefix is None:
+        return int(number)
+    exponent = _SIZE_EXPONENTS[prefix.lower()]
+    base = 1024 if suffix is not None and suffix.lower() == "ib" else 1000
+    return int(number * base**exponent)
+
+
 class ParsedSize(InvertibleParamType):
     """Converts a string value representing a size to an integer.
 
@@ -369,7 +442,7 @@ class ParsedSize(InvertibleParamType):
 
         """
         try:
-            return parse_size(str(value))
+            return _parse_size(str(value))
         except Exception as exc:  # pylint: disable=broad-except
             self.fail(str(exc), param, ctx)
 
@@ -394,6 +467,8 @@ class FormattedString(click.ParamType):
     name = "string"
     format_: FORMATS | None = None
     pattern: str | None = None
+    _pattern: re.Pattern | None = None
+    _check_format: bool = False
 
     def __init__(
         self,
@@ -402,6 +477,8 @@ class FormattedString(click.ParamType):
     ) -> None:
         if format_ not in [*get_args(FORMATS), None]:
             raise ValueError(f"Invalid format: {format_}")
+        # Formats without a checker (eg. missing optional dependencies) always pass
+        self._check_format = format_ in draft7_format_checker.checkers
         self.format_ = format_
         self.pattern = pattern
 
@@ -432,10 +509,17 @@ class FormattedString(click.ParamType):
             return value
         _value = str(value)
         try:
-            if self.format_ is not None:
+            if self._check_format:
                 draft7_format_checker.check(_value, self.format_)
-            if self.pattern is not None and not re.search(self.pattern, _value):
-                raise FormatError(f"'{value}' does not match pattern: '{self.pattern}'")
+            if self.pattern is not None:
+                # Compiled on first use, so that a pattern Python cannot parse
+                # only fails when a value is actually given
+                if self._pattern is None:
+                    self._pattern = re.compile(self.pattern)
+                if not self._pattern.search(_value):
+                    raise FormatError(
+                        f"'{value}' does not match pattern: '{self.pattern}'"
+                    )
         except FormatError as exc:
             self.fail(exc.message, param, ctx)
         except Exception as exc:  # pylint: disable=broad-except
@@ -452,7 +536,15 @@ class FormattedString(click.ParamType):
         return metavar
 
 
-def click_type(  # type: ignore[return]
+_PATH = click.Path(path_type=Path)
+
+
+@cache
+def _choice(enum: tuple) -> click.Choice:
+    return click.Choice(list(enum), case_sensitive=False)
+
+
+def click_type(
     type_: SCHEMA_TYPES | None = None,
     enum: list | None = None,
     items_type: ITEMS_TYPES | None = None,
@@ -481,9 +573,45 @@ def click_type(  # type: ignore[return]
         type: The Python type corresponding to the property type.
 
     """
-    match type_:
-        case _ if enum:
+    if enum:
+        try:
+            return _choice(tuple(enum))
+        except TypeError:
+            # Unhashable enum values
             return click.Choice(enum, case_sensitive=False)
+
+    if type_ == "path":
+        return _PATH
+
+    return _click_type(
+        type_,
+        items_type,
+        items_format,
+        items_min,
+        items_max,
+        format_,
+        pattern,
+        min_,
+        max_,
+    )
+
+
+# Param types are stateless, so identical flags can share a single instance.
+# The arguments are positional to keep the lru_cache key a flat tuple.
+@lru_cache(maxsize=None, typed=True)
+def _click_type(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    type_: SCHEMA_TYPES | None,
+    items_type: ITEMS_TYPES | None,
+    items_format: FORMATS | None,
+    items_min: int | float | None,
+    items_max: int | float | None,
+    format_: FORMATS | None,
+    pattern: str | None,
+    min_: int | float | None,
+    max_: int | float | None,
+) -> Any:
+    """Build the click param type for a non-enum flag specification."""
+    match type_:
         case "string":
             return FormattedString(format_, pattern)
         case "number" if min_ is not None or max_ is not None:
@@ -505,8 +633,6 @@ def click_type(  # type: ignore[return]
                 items_min,
                 items_max,
             )
-        case "path":
-            return click.Path(path_type=Path)
         case "size":
             return ParsedSize()
         case _:
@@ -70,6 +70,6 @@ class Config(data.Container):
 
     def set_defaults(self) -> None:
         """Updates the configuration from keyword arguments"""
-        for flag in get_flags(self.__schema__):
+        for flag in self.__schema__.flags:
             if flag.default is not None and flag.key not in self:
                 self[flag.key] = flag.convert(flag.default)
@@ -1,6 +1,6 @@
 """Flag class for command-line options."""
 
-from functools import partial
+from functools import cached_property, partial
 from typing import Any, Callable, SupportsFloat, Type, get_args
 
 import rich_click as click
@@ -23,6 +23,25 @@ def _convert_float(value: SupportsFloat | None) -> float | None:
     return float(value) if value is not None else None
 
 
+def _invalidate(*names: str) -> Callable:
+    """Create an on_setattr hook that drops the named cached properties."""
+
+    def hook(instance: "Flag", _: Any, value: Any) -> Any:
+        for name in names:
+            instance.__dict__.pop(name, None)
+        return value
+
+    return hook
+
+
+# Fields that click_type is derived from
+_click_type_setattr = setters.pipe(
+    setters.convert,
+    setters.validate,
+    _invalidate("click_type"),
+)
+
+
 @define(slots=False)
 class Flag:
     """Represents a flag used for command-line options.
@@ -50,36 +69,57 @@ class Flag:
 
     """
 
-    key: tuple[str, ...] = field(converter=tuple, on_setattr=setters.convert)
-    type: SCHEMA_TYPES | None = field(default=None)
-    items_type: ITEMS_TYPES | None = field(default=None)
-    items_format: FORMATS | None = field(default=None)
+    key: tuple[str, ...] = field(
+        converter=tuple,
+        on_setattr=setters.pipe(setters.convert, _invalidate("flag", "no_flag")),
+    )
+    type: SCHEMA_TYPES | None = field(
+        default=None,
+        on_setattr=_click_type_setattr,
+    )
+    items_type: ITEMS_TYPES | None = field(
+        default=None,
+        on_setattr=_click_type_setattr,
+    )
+    items_format: FORMATS | None = field(
+        default=None,
+        on_setattr=_click_type_setattr,
+    )
     items_min: int | None = field(
         default=None,
         converter=_convert_float,
-        on_setattr=setters.convert,
+        on_setattr=_click_type_setattr,
     )
     items_max: int | None = field(
         default=None,
         converter=_convert_float,
-        on_setattr=setters.convert,
+        on_setattr=_click_type_setattr,
     )
     min: int | None = field(
         default=None,
         converter=_convert_float,
-        on_setattr=setters.convert,
+        on_setattr=_click_type_setattr,
     )
     max: int | None = field(
         default=None,
         converter=_convert_float,
-        on_setattr=setters.convert,
+        on_setattr=_click_type_setattr,
+    )
+    format: FORMATS | None = field(
+        default=None,
+        on_setattr=_click_type_setattr,
+    )
+    pattern: str | None = field(
+        default=None,
+        on_setattr=_click_type_setattr,
     )
-    format: FORMATS | None = field(default=None)
-    pattern: str | None = field(default=None)
     description: str | None = field(default=None)
     default: Any = field(default=None)
     value: Any = field(default=None)
-    enum: list[Any] | None = field(default=None)
+    enum: list[Any] | None = field(
+        default=None,
+        on_setattr=_click_type_setattr,
+    )
     required: bool = field(default=False)
     secret: bool = field(default=False)
 
@@ -110,14 +150,14 @@ class Flag:
 
         """
         _converter: Callable
-        if isinstance(self.click_type, click.ParamType):
-            _converter = partial(self.click_type.convert, ctx=ctx, param=param)
+        if isinstance(click_type_ := self.click_type, click.ParamType):
+            _converter = partial(click_type_.convert, ctx=ctx, param=param)
         else:
-            _converter = self.click_type
+            _converter = click_type_
 
         return _converter(value)
 
-    @property
+    @cached_property
     def click_type(
         self,
     ) -> (
@@ -151,7 +191,7 @@ class Flag:
             items_max=self.items_max,
         )
 
-    @property
+    @cached_property
     def flag(self) -> str:
         """Constructs the flag name from the key.
 
@@ -166,7 +206,7 @@ class Flag:
         """
         return "_".join(self.key)
 
-    @property
+    @cached_property
     def no_flag(self) -> str:
         """Constructs the no-flag name from the key.
 
@@ -190,29 +230,28 @@ class Flag:
             Callable: A click.option decorator
 
         """
+        click_type_ = self.click_type
+        default = self.value or self.default
+        show_default: bool | str
+        if self.secret:
+            show_default = False
+        elif default and isinstance(click_type_, InvertibleParamType):
+            show_default = click_type_.invert(default)
+        else:
+            show_default = str(default)
+
         return click.option(
             (
                 f"--{self.flag}/--{self.no_flag}"
                 if self.type == "boolean"
                 else f"--{self.flag}"
             ),
-            type=self.click_type,
+            type=click_type_,
             multiple=self.items_type == "array",
             default=(
-                True
-                if self.type == "boolean" and self.default is None
-                else self.value or self.default
+                True if self.type == "boolean" and self.default is None else default
             ),
             required=self.required,
             help=self.description,
-            show_default=(
-                False
-                if self.secret
-                else (
-                    self.click_type.invert(default)
-                    if (default := self.value or self.default)
-                    and isinstance(self.click_type, InvertibleParamType)
-                    else str(default)
-                )
-            ),
+            show_default=show_default,
         )
@@ -3,7 +3,7 @@
 from copy import deepcopy
 from functools import cache, partial, reduce, singledispatch
 from pathlib import Path
-from typing import Callable, Generator, Mapping
+from typing import Any, Callable, Generator, Mapping
 
 from frozendict import frozendict
 from jsonschema.protocols import Validator
@@ -277,10 +277,29 @@ def if_(
     compiled.pop("if")
 
 
+_CONDITIONAL_KEYWORDS = frozenset(
+    {
+        "if",
+        "anyOf",
+        "oneOf",
+        "allOf",
+        "dependentSchemas",
+    },
+)
+
+
+def _has_conditionals(node: Any) -> bool:
+    """Check if any (nested) key in a schema is a conditional keyword."""
+    return isinstance(node, dict) and any(
+        key in _CONDITIONAL_KEYWORDS or _has_conditionals(value)
+        for key, value in node.items()
+    )
+
+
 @singledispatch
 def get_flags(schema: data.Container, _data: Mapping | None = None) -> list[Flag]:
     """Get the flags for a configuration schema."""
-    return get_flags(util.freeze(data.as_dict(schema)), util.freeze(_data))
+    return get_flags(util.freeze(schema), util.freeze(_data))
 
 
 @get_flags.register
@@ -290,16 +309,7 @@ def _(schema: frozendict, _data: frozendict | None = None) -> list[Flag]:
     schema_thawed = util.unfreeze(schema)
     flags: dict[tuple[str, ...], Flag] = {}
 
-    while any(
-        keyword in (kw for node in util.map_nested_keys(schema_thawed) for kw in node)
-        for keyword in [
-            "if",
-            "anyOf",
-            "oneOf",
-            "allOf",
-            "dependentSchemas",
-        ]
-    ):
+    while _has_conditionals(schema_thawed):
         compiled = deepcopy(schema_thawed)
         compile_conditional = extend(
             NullValidator,
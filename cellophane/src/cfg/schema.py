@@ -10,6 +10,7 @@ from ruamel.yaml.scalarstring import DoubleQuotedScalarString, LiteralScalarStri
 
 from cellophane.src import data, util
 
+from .flag import Flag
 from .jsonschema_ import get_flags
 from .util import comment_yaml_block, dump_yaml
 
@@ -53,14 +54,17 @@ class Schema(data.Container):
     @classmethod
     def from_file(cls, path: Path | Sequence[Path]) -> "Schema":
         """Loads the schema from a file or a sequence of files"""
-        if isinstance(path, Path):
-            with open(path, encoding="utf-8") as handle:
-                return cls(YAML(typ="safe").load(handle) or {})
-        elif isinstance(path, Sequence):
-            schema: dict = {}
-            for p in path:
-                schema = util.merge_mappings(schema, data.as_dict(cls.from_file(p)))
-            return cls(schema)
+        yaml = YAML(typ="safe")
+        schema: dict = {}
+        for p in [path] if isinstance(path, Path) else path:
+            with open(p, encoding="utf-8") as handle:
+                schema = util.merge_mappings(schema, yaml.load(handle) or {})
+        return cls(schema)
+
+    @cached_property
+    def flags(self) -> list[Flag]:
+        """Flags for the schema without any configuration data applied"""
+        return get_flags(self)
 
     @cached_property
     def example_config(self) -> str:
@@ -35,6 +35,10 @@ def with_options(schema: Schema) -> Callable:
     """
 
     def wrapper(callback: Callable) -> Callable:
+        # Only depends on the schema, so it is built once per command
+        _dummy_cmd: click.Command | None = None
+        _pass_config = click.make_pass_decorator(Config)(callback)
+
         @click.command(
             add_help_option=False,
             context_settings={
@@ -49,7 +53,7 @@ def with_options(schema: Schema) -> Callable:
         )
         @click.pass_context
         def inner(ctx: click.Context, config_file: Path | None) -> None:
-            nonlocal callback
+            nonlocal _dummy_cmd
 
             try:
                 config_data = (
@@ -61,9 +65,10 @@ def with_options(schema: Schema) -> Callable:
                 raise click.FileError(str(config_file), str(exc))
 
             # Create a dummy command to collect any flags that are passed
-            _dummy_cmd = click.command()(lambda: None)
-            for flag in get_flags(schema):
-                _dummy_cmd = flag.click_option(_dummy_cmd)
+            if _dummy_cmd is None:
+                _dummy_cmd = click.command()(lambda: None)
+                for flag in schema.flags:
+                    _dummy_cmd = flag.click_option(_dummy_cmd)
             _dummy_ctx = _dummy_cmd.make_context(
                 ctx.info_name,
                 ctx.args.copy(),
@@ -94,8 +99,7 @@ def with_options(schema: Schema) -> Callable:
                 )
 
             # Add flags to the callback with the values from the dummy command
-            callback = click.make_pass_decorator(Config)(callback)
-            _callback = click.command(callback)
+            _callback = click.command(_pass_config)
             for flag in get_flags(schema, data.as_dict(config)):
                 _callback = flag.click_option(_callback)
 
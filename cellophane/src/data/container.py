@@ -1,14 +1,28 @@
 """Base container class for the Config, Sample, and Samples classes."""
 
 from copy import deepcopy
-from functools import reduce
-from typing import Any, Iterator, Mapping, Sequence
+from functools import lru_cache, reduce
+from types import MappingProxyType
+from typing import Any, Hashable, Iterator, Mapping, Sequence, cast
 
-from attrs import define, field, fields_dict
+from attrs import Attribute, define, field, fields_dict
+from frozendict import frozendict
 
 from .. import util
 
 
+# Bounded as mixin classes are re-created when samples are unpickled
+@lru_cache(maxsize=128)
+def _cached_fields_dict(cls: Hashable) -> MappingProxyType[str, Attribute]:
+    return MappingProxyType(fields_dict(cast(type, cls)))
+
+
+def _fields_dict(cls: type) -> MappingProxyType[str, Attribute]:
+    """Return a read-only, cached view of the attrs fields of a class."""
+    # attrs sets __hash__ = None, so mypy does not consider the class Hashable
+    return _cached_fields_dict(cast(Hashable, cls))
+
+
 class PreservedDict(dict):
     """Dict subclass to allow dict inside Container"""
 
@@ -45,7 +59,7 @@ class Container(Mapping):
         **kwargs: Any,
     ) -> None:
         _data = __data__ or {}
-        for key in [k for k in kwargs if k not in fields_dict(self.__class__)]:
+        for key in [k for k in kwargs if k not in _fields_dict(self.__class__)]:
             _data[key] = kwargs.pop(key)
         self.__attrs_init__(*args, **kwargs)
         for k, v in _data.items():
@@ -65,7 +79,7 @@ class Container(Mapping):
             return False
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name not in fields_dict(self.__class__):
+        if name not in _fields_dict(self.__class__):
             self[name] = value
         else:
             super().__setattr__(name, value)
@@ -75,7 +89,7 @@ class Container(Mapping):
             item = Container(item)
 
         match key:
-            case str(k) if k in fields_dict(self.__class__):
+            case str(k) if k in _fields_dict(self.__class__):
                 self.__setattr__(k, item)
             case str(k) if k.isidentifier():
                 self.__data__[k] = item
@@ -92,7 +106,7 @@ class Container(Mapping):
 
     def __getitem__(self, key: str | Sequence[str]) -> Any:
         match key:
-            case str(k) if k in fields_dict(self.__class__):
+            case str(k) if k in _fields_dict(self.__class__):
                 return super().__getattribute__(k)
             case str(k):
                 return self.__data__[k]
@@ -111,7 +125,7 @@ class Container(Mapping):
 
     def __deepcopy__(self, memo: dict[int, Any]) -> Any:
         _instance = self.__class__(
-            **{deepcopy(k): deepcopy(self[k]) for k in fields_dict(self.__class__)},
+            **{deepcopy(k): deepcopy(self[k]) for k in _fields_dict(self.__class__)},
         )
         _instance.__data__ = deepcopy(self.__data__)
         return _instance
@@ -121,3 +135,19 @@ class Container(Mapping):
 
     def __iter__(self) -> Iterator[str]:
         return iter(self.__data__)
+
+
+@util.freeze.register
+def _(data: Container) -> frozendict:
+    """Freezes a container directly, without an intermediate dictionary.
+
+    Args:
+    ----
+        data (Container): The container to freeze.
+
+    Returns:
+    -------
+        frozendict: The frozen container data.
+
+    """
+    return frozendict({k: util.freeze(v) for k, v in data.__data__.items()})
@@ -1,17 +1,18 @@
 """Outut classes for copying files to another directory."""
 
+import os
 from glob import glob
+from itertools import islice
 from pathlib import Path
 from typing import Iterable
 from warnings import warn
 
 from attrs import define, field
-from attrs.setters import convert
 
 from .container import Container
 
 
-@define
+@define(frozen=True)
 class Output:
     """Output file to be copied to the another directory.
     """
@@ -19,65 +20,56 @@ class Output:
     src: Path = field(
         kw_only=True,
         converter=Path,
-        on_setattr=convert,
     )
     dst: Path = field(
         kw_only=True,
         converter=Path,
-        on_setattr=convert,
     )
     checkpoint: str = field(
         default="main",
         kw_only=True,
         converter=str,
-        on_setattr=convert,
     )
 
     optional: bool = field(
         default=False,
         kw_only=True,
         converter=bool,
-        on_setattr=convert,
     )
 
     def __hash__(self) -> int:
         return hash((self.src, self.dst))
 
 
-@define
+@define(frozen=True)
 class OutputGlob:  # type: ignore[no-untyped-def]
     """Output glob find files to be copied to the another directory.
     """
 
     src: str = field(
         converter=str,
-        on_setattr=convert,
     )
     dst_dir: str | None = field(  # type: ignore[var-annotated]
         default=None,
         kw_only=True,
         converter=lambda v: v if v is None else str(v),
-        on_setattr=convert,
     )
     dst_name: str | None = field(  # type: ignore[var-annotated]
         default=None,
         kw_only=True,
         converter=lambda v: v if v is None else str(v),
-        on_setattr=convert,
     )
 
     checkpoint: str = field(
         default="main",
         kw_only=True,
         converter=str,
-        on_setattr=convert,
     )
 
     optional: bool = field(
         default=False,
         kw_only=True,
         converter=bool,
-        on_setattr=convert,
     )
 
     def __hash__(self) -> int:
@@ -105,8 +97,12 @@ class OutputGlob:  # type: ignore[no-untyped-def]
 
         """
         outputs = set()
+        # Glob results by pattern, reused when samples resolve to the same pattern
+        globbed: dict[str, list[Path]] = {}
+        # Warnings are collected and issued once each after resolving
+        messages: dict[str, None] = {}
 
-        for sample in samples:
+        for sample in self._samples_to_resolve(samples):
             meta = {
                 "samples": samples,
                 "config": config,
@@ -114,20 +110,10 @@ class OutputGlob:  # type: ignore[no-untyped-def]
                 "sample": sample,
             }
 
-            match self.src.format(**meta):
-                case p if Path(p).is_absolute():
-                    pattern = p
-                case p if Path(p).is_relative_to(workdir):
-                    pattern = p
-                case p:
-                    pattern = str(workdir / p)
-
-            if not (matches := [Path(m) for m in glob(pattern)]) and not self.optional:
-                warn(f"No files matched pattern '{pattern}'")
-
+            matches = self._glob(self._pattern(meta, workdir), globbed, messages)
             for m in matches:
                 match self.dst_dir:
-                    case str(d) if Path(d).is_absolute():
+                    case str(d) if os.path.isabs(d):
                         dst_dir = Path(d.format(**meta))
                     case str(d):
                         dst_dir = config.resultdir / d.format(**meta)
@@ -138,23 +124,61 @@ class OutputGlob:  # type: ignore[no-untyped-def]
                     case None:
                         dst_name = m.name
                     case _ if len(matches) > 1:
-                        warn(
+                        messages[
                             f"Destination name {self.dst_name} will be ignored "
-                            f"as '{self.src}' matches multiple files",
-                        )
+                            f"as '{self.src}' matches multiple files"
+                        ] = None
                         dst_name = m.name
                     case str() as n:
                         dst_name = n.format(**meta)
 
-                dst = Path(dst_dir) / dst_name
-
                 outputs.add(
                     Output(
                         src=m,
-                        dst=dst,
+                        dst=os.path.join(dst_dir, dst_name),
                         optional=self.optional,
                         checkpoint=self.checkpoint.format(**meta),
                     ),
                 )
 
+        for message in messages:
+            warn(message)
+
         return outputs
+
+    def _samples_to_resolve(self, samples: Iterable) -> Iterable:
+        """Return the samples to resolve the glob for.
+
+        If no template refers to the sample, every sample resolves to the same
+        outputs, so only the first one needs to be processed.
+        """
+        if any(
+            "{sample" in t
+            for t in (self.src, self.dst_dir, self.dst_name, self.checkpoint)
+            if t is not None
+        ):
+            return samples
+        return islice(samples, 1)
+
+    def _pattern(self, meta: dict, workdir: Path) -> str:
+        """Format the source pattern and anchor relative patterns in workdir."""
+        match self.src.format(**meta):
+            case p if os.path.isabs(p):
+                return p
+            case p if Path(p).is_relative_to(workdir):
+                return p
+            case p:
+                return str(workdir / p)
+
+    def _glob(
+        self,
+        pattern: str,
+        globbed: dict[str, list[Path]],
+        messages: dict[str, None],
+    ) -> list[Path]:
+        """Glob a pattern once per resolve, noting patterns without matches."""
+        if (matches := globbed.get(pattern)) is None:
+            matches = globbed[pattern] = [Path(m) for m in glob(pattern)]
+            if not matches and not self.optional:
+                messages[f"No files matched pattern '{pattern}'"] = None
+        return matches
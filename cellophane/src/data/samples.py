@@ -1,18 +1,29 @@
 """Sample and Samples class definitions."""
 
+import json
 from collections import UserList
-from contextlib import suppress
-from copy import deepcopy
+from copy import copy
 from pathlib import Path
-from typing import Any, ClassVar, Iterable, Literal, Sequence, TypeVar, Union, overload
+from typing import (
+    Any,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    SupportsIndex,
+    TypeVar,
+    Union,
+    overload,
+)
 from uuid import UUID, uuid4
 
-from attrs import define, field, fields_dict, make_class
+from attrs import define, field, make_class
 from attrs.setters import convert, frozen
 from ruamel.yaml import YAML
 
 from .. import util
-from .container import Container
+from .container import Container, _fields_dict
 from .exceptions import MergeSamplesTypeError, MergeSamplesUUIDError
 from .merger import Merger
 from .output import Output, OutputGlob
@@ -157,13 +168,13 @@ class Sample:  # type: ignore[no-untyped-def]
         return getattr(self, key)
 
     def __setitem__(self, key: str, value: Any) -> None:
-        if key in fields_dict(self.__class__):
+        if key in _fields_dict(self.__class__):
             setattr(self, key, value)
         else:
             raise KeyError(f"Sample has no attribute '{key}'")
 
     def __getstate__(self) -> dict[str, Any]:
-        return {k: getattr(self, k) for k in fields_dict(self.__class__)}
+        return {k: getattr(self, k) for k in _fields_dict(self.__class__)}
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         for k, v in state.items():
@@ -175,13 +186,18 @@ class Sample:  # type: ignore[no-untyped-def]
         kwargs = {"id": state.pop("id")}
         return (_reconstruct, (Sample, self._mixins, args, kwargs, state))
 
+    def __copy__(self) -> "Sample":
+        _sample = object.__new__(self.__class__)
+        _sample.__dict__.update(self.__dict__)
+        return _sample
+
     def __and__(self, other: "Sample") -> "Sample":
         if self.uuid != other.uuid:
             raise MergeSamplesUUIDError
 
-        _sample = deepcopy(self)
+        _sample = copy(self)
         for _field in (
-            f for f in fields_dict(self.__class__) if f not in ["id", "uuid"]
+            f for f in _fields_dict(self.__class__) if f not in ["id", "uuid"]
         ):
             setattr(
                 _sample,
@@ -249,6 +265,31 @@ class Sample:  # type: ignore[no-untyped-def]
 S = TypeVar("S", bound="Sample")
 
 
+def _has_existing_files(sample: Sample, exists: dict[Path, bool]) -> bool:
+    """Check that a sample has files and that all of them exist.
+
+    Args:
+    ----
+        sample (Sample): The sample to check.
+        exists (dict[Path, bool]): Results of previous existence checks, updated
+            in-place so that files shared between samples are only checked once.
+
+    """
+    if not sample.files:
+        return False
+    for file in sample.files:
+        if file not in exists:
+            exists[file] = file.exists()
+        if not exists[file]:
+            return False
+    return True
+
+
+def _invalidate_index(instance: "Samples", _: Any, value: list[S]) -> list[S]:
+    instance._uuid_index = None  # pylint: disable=protected-access
+    return value
+
+
 @define(slots=False, order=False, init=False)
 class Samples(UserList[S]):
     """Base samples class represents a list of samples.
@@ -269,24 +310,54 @@ class Samples(UserList[S]):
 
     """
 
-    data: list[S] = field(factory=list)
+    data: list[S] = field(factory=list, on_setattr=_invalidate_index)
     sample_class: ClassVar[type[Sample]] = Sample
     merge: ClassVar[Merger] = Merger()
     output: set[Output | OutputGlob] = field(
         factory=set, converter=set, on_setattr=convert,
     )
     _mixins: ClassVar[tuple[type["Samples"], ...]] = ()
+    # Lazily built {uuid: position} lookup (not an attrs field, see _locate)
+    _uuid_index = None
 
     def __init__(self, data: list | None = None, /, **kwargs: Any) -> None:
         self.__attrs_init__(**kwargs)  # pylint: disable=no-member
         super().__init__(data or [])
 
+    def _build_index(self) -> dict[UUID, int]:
+        index: dict[UUID, int] = {}
+        for idx, sample in enumerate(self.data):
+            index.setdefault(sample.uuid, idx)
+        self._uuid_index = index
+        return index
+
+    def _locate(self, uuid: UUID) -> int | None:
+        """Return the position of the first sample with a UUID, or None.
+
+        Index hits are verified against the list. As `data` can be modified
+        in-place without the index noticing, a miss falls back to a linear scan,
+        and the index is rebuilt if that scan finds the sample. If a UUID occurs
+        more than once, and `data` was modified in-place, a hit may point to a
+        later occurrence than the first.
+        """
+        if (index := self._uuid_index) is None:
+            return self._build_index().get(uuid)
+
+        idx = index.get(uuid)
+        if idx is not None and idx < len(self.data) and self.data[idx].uuid == uuid:
+            return idx
+
+        idx = next((i for i, s in enumerate(self.data) if s.uuid == uuid), None)
+        if idx is not None:
+            self._build_index()
+        return idx
+
     def __getitem__(self, key: int | UUID) -> S:  # type: ignore[override]
         if isinstance(key, int):
             return super().__getitem__(key)
 
-        if isinstance(key, UUID) and key in self:
-            return next(s for s in self if s.uuid == key)
+        if isinstance(key, UUID) and (idx := self._locate(key)) is not None:
+            return self.data[idx]
 
         if isinstance(key, UUID):
             raise KeyError(f"Sample with UUID {key.hex} not found")
@@ -296,28 +367,69 @@ class Samples(UserList[S]):
     def __setitem__(self, key: int | UUID, value: S) -> None:  # type: ignore[override]
         if isinstance(key, int):
             super().__setitem__(key, value)
-        elif isinstance(key, UUID) and key in self:
-            self[self.index(self[key])] = value
+            self._uuid_index = None
+        elif isinstance(key, UUID) and (pos := self._locate(key)) is not None:
+            self[pos] = value
         elif isinstance(key, UUID):
             self.append(value)
         else:
             raise TypeError(f"Key {key} is not an int or a UUID")
 
+    def __delitem__(self, key: SupportsIndex | slice) -> None:
+        super().__delitem__(key)
+        self._uuid_index = None
+
     def __contains__(self, item: S | UUID) -> bool:  # type: ignore[override]
         if isinstance(item, UUID):
-            return any(s.uuid == item for s in self)
+            return self._locate(item) is not None
         else:
             return super().__contains__(item)
 
+    def __iadd__(self, other: Iterable[S]) -> "Samples":  # type: ignore[override]
+        super().__iadd__(other)
+        self._uuid_index = None
+        return self
+
+    def append(self, item: S) -> None:
+        if self._uuid_index is not None:
+            self._uuid_index.setdefault(item.uuid, len(self.data))
+        super().append(item)
+
+    def insert(self, i: int, item: S) -> None:
+        super().insert(i, item)
+        self._uuid_index = None
+
+    def extend(self, other: Iterable[S]) -> None:
+        super().extend(other)
+        self._uuid_index = None
+
+    def pop(self, i: int = -1) -> S:
+        item = super().pop(i)
+        self._uuid_index = None
+        return item
+
+    def remove(self, item: S) -> None:
+        super().remove(item)
+        self._uuid_index = None
+
+    def clear(self) -> None:
+        super().clear()
+        self._uuid_index = None
+
+    def __iter__(self) -> Iterator[S]:
+        # Sequence.__iter__ would go through __getitem__ for every sample
+        return iter(self.data)
+
     def __str__(self) -> str:
-        return "\n".join([str(s) for s in self])
+        return "\n".join([str(s) for s in self.data])
 
     def __getstate__(self) -> dict[str, Any]:
-        return {k: getattr(self, k) for k in fields_dict(self.__class__)}
+        return {k: getattr(self, k) for k in _fields_dict(self.__class__)}
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         for k, v in state.items():
             object.__setattr__(self, k, v)
+        self._uuid_index = None
 
     def __reduce__(self) -> str | tuple[Any, ...]:
         state = self.__getstate__()
@@ -326,19 +438,35 @@ class Samples(UserList[S]):
         cls_kwargs = {"sample_class": self.sample_class}
         return (_reconstruct, (Samples, self._mixins, args, kwargs, state, cls_kwargs))
 
+    def __copy__(self) -> "Samples":
+        samples = object.__new__(self.__class__)
+        samples.__dict__.update(self.__dict__)
+        samples.__dict__.update(
+            data=[*self.data],
+            output={*self.output},
+            _uuid_index=None,
+        )
+        return samples
+
     def __or__(self, other: "Samples") -> "Samples":
         if self.__class__.__name__ != other.__class__.__name__:
             raise MergeSamplesTypeError(f"Cannot merge {self.__class__} with {other.__class__}")
 
-        samples = deepcopy(self)
+        samples = copy(self)
+        # Track positions locally, as misses in _locate fall back to a scan
+        index = samples._build_index()  # pylint: disable=protected-access
         for sample in other:
-            samples[sample.uuid] = sample
+            if (idx := index.get(sample.uuid)) is not None:
+                samples.data[idx] = sample
+            else:
+                index[sample.uuid] = len(samples.data)
+                samples.data.append(sample)
 
         return samples
 
     def __and__(self, other: "Samples") -> "Samples":
-        samples = deepcopy(self)
-        for field_ in fields_dict(self.__class__):
+        samples = copy(self)
+        for field_ in _fields_dict(self.__class__):
             self_ = getattr(self, field_)
             other_ = getattr(other, field_)
             setattr(samples, field_, self.merge(field_, self_, other_))
@@ -347,13 +475,11 @@ class Samples(UserList[S]):
     @merge.register("data")
     @staticmethod
     def _merge_data(this: list[Sample], that: list[Sample]) -> list[Sample]:
+        this_by_uuid = {s.uuid: s for s in reversed(this)}
+        that_by_uuid = {s.uuid: s for s in reversed(that)}
         data: list[Sample] = []
-        for uuid in {s.uuid for s in (*this, *that)}:
-            this_, that_ = None, None
-            with suppress(StopIteration):
-                this_ = next(s for s in this if s.uuid == uuid)
-            with suppress(StopIteration):
-                that_ = next(s for s in that if s.uuid == uuid)
+        for uuid in dict.fromkeys(s.uuid for s in (*this, *that)):
+            this_, that_ = this_by_uuid.get(uuid), that_by_uuid.get(uuid)
             data.append(
                 this_ & that_ if this_ and that_ else this_ or that_,  # type: ignore[arg-type]
             )
@@ -369,10 +495,14 @@ class Samples(UserList[S]):
 
     @classmethod
     def from_file(cls, path: Path) -> "Samples":
-        """Get samples from a YAML file"""
+        """Get samples from a YAML (or JSON) file"""
         samples = []
-        yaml = YAML(typ="safe")
-        for sample in yaml.load(path):
+        if path.suffix == ".json":
+            # JSON is a subset of YAML, but the stdlib parser is much faster
+            _samples = json.loads(path.read_bytes())
+        else:
+            _samples = YAML(typ="safe").load(path)
+        for sample in _samples:
             _id = sample.pop("id")
             samples.append(
                 cls.sample_class(id=str(_id), **sample),  # type: ignore[call-arg]
@@ -472,10 +602,11 @@ class Samples(UserList[S]):
         if by is None:
             yield None, self
         else:
-            yield from {
-                sample[by]: self.__class__([li for li in self if li[by] == sample[by]])
-                for sample in self
-            }.items()
+            groups: dict[Any, list[S]] = {}
+            for sample in self.data:
+                groups.setdefault(sample[by], []).append(sample)
+            for key, group in groups.items():
+                yield key, self.__class__(group)
 
     @property
     def unique_ids(self) -> set[str]:
@@ -499,7 +630,7 @@ class Samples(UserList[S]):
             ```
 
         """
-        return {s.id for s in self}
+        return {s.id for s in self.data}
 
     @property
     def with_files(self) -> "Samples":
@@ -510,12 +641,9 @@ class Samples(UserList[S]):
             Class: A new instance of the class with only the samples with files.
 
         """
+        exists: dict[Path, bool] = {}
         return self.__class__(
-            [
-                sample
-                for sample in self
-                if sample.files and all(Path(f).exists() for f in sample.files)
-            ],
+            [sample for sample in self.data if _has_existing_files(sample, exists)],
         )
 
     @property
@@ -527,12 +655,9 @@ class Samples(UserList[S]):
             Class: A new instance of the class with only the samples without files.
 
         """
+        exists: dict[Path, bool] = {}
         return self.__class__(
-            [
-                sample
-                for sample in self
-                if not sample.files or any(not Path(f).exists() for f in sample.files)
-            ],
+            [sample for sample in self.data if not _has_existing_files(sample, exists)],
         )
 
     @property
@@ -547,9 +672,7 @@ class Samples(UserList[S]):
             Class: A new instance of the class with only the completed samples.
 
         """
-        return self.__class__(
-            [sample for sample in self if sample.processed and not sample.failed], output=self.output,
-        )
+        return self.__class__([*self.iter_complete()], output=self.output)
 
     @property
     def unprocessed(self) -> "Samples":
@@ -564,7 +687,8 @@ class Samples(UserList[S]):
 
         """
         return self.__class__(
-            [sample for sample in self if not sample.failed and not sample.processed], output=self.output,
+            [s for s in self.data if not s.failed and not s.processed],
+            output=self.output,
         )
 
     @property
@@ -579,4 +703,24 @@ class Samples(UserList[S]):
             Class: A new instance of the class with only the failed samples.
 
         """
-        return self.__class__([sample for sample in self if sample.failed])
+        return self.__class__([*self.iter_failed()])
+
+    def iter_complete(self) -> Iterator[S]:
+        """Iterate over completed samples without creating a new Samples object.
+
+        Yields
+        ------
+            Sample: Samples that are processed and not failed.
+
+        """
+        return (s for s in self.data if s.processed and not s.failed)
+
+    def iter_failed(self) -> Iterator[S]:
+        """Iterate over failed samples without creating a new Samples object.
+
+        Yields
+        ------
+            Sample: Samples that are failed.
+
+        """
+        return (s for s in self.data if s.failed)
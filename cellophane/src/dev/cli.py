@@ -26,6 +26,14 @@ from .util import (
 )
 
 
+def _parse_modules(module_strings: tuple[str, ...]) -> list[tuple[str, str | None]]:
+    """Split MODULE[@VERSION] arguments into (module, version) pairs."""
+    return [
+        (module_, version if sep else None)
+        for module_, sep, version in (m.partition("@") for m in module_strings)
+    ]
+
+
 @click.group(
     context_settings={
         "help_option_names": ["-h", "--help"],
@@ -93,9 +101,7 @@ def main(
 @click.argument(
     "modules",
     metavar="MODULE[@BRANCH] ...",
-    callback=lambda ctx, param, module_strings: [
-        tuple(m.split("@")) if "@" in m else (m, None) for m in module_strings
-    ],
+    callback=lambda ctx, param, module_strings: _parse_modules(module_strings),
     nargs=-1,
 )
 @click.pass_context
@@ -169,9 +175,10 @@ def add(
     logger: logging.LoggerAdapter,
 ) -> None:
     """Add module(s)"""
+    tags = {r.name for r in repo.tags}
     for module_, ref, version in modules:
         try:
-            ref_ = ref if ref in [r.name for r in repo.tags] else f"modules/{ref}"
+            ref_ = ref if ref in tags else f"modules/{ref}"
             repo.git.read_tree(
                 f"--prefix=modules/{module_}/",
                 "-u",
@@ -188,9 +195,7 @@ def add(
             repo.head.reset("HEAD", index=True, working_tree=True)
             continue
         else:
-            repo.index.add("config.example.yaml")
-            repo.index.add("modules/requirements.txt")
-            repo.index.write()
+            repo.index.add(["config.example.yaml", "modules/requirements.txt"])
             repo.index.commit(f"feat(cellophane): Added '{module_}@{version}'")
             logger.info(f"Added '{module_}@{version}'")
 
@@ -206,9 +211,10 @@ def update(
     """Update module(s)"""
     del kwargs  # Unused
 
+    tags = {r.name for r in repo.tags}
     for module_, ref, version in modules:
         try:
-            ref_ = ref if ref in [r.name for r in repo.tags] else f"modules/{ref}"
+            ref_ = ref if ref in tags else f"modules/{ref}"
             repo.index.remove(path / f"modules/{module_}", working_tree=True, r=True)
             repo.git.read_tree(
                 f"--prefix=modules/{module_}/",
@@ -225,9 +231,7 @@ def update(
             repo.head.reset("HEAD", index=True, working_tree=True)
             continue
         else:
-            repo.index.add("config.example.yaml")
-            repo.index.add("modules/requirements.txt")
-            repo.index.write()
+            repo.index.add(["config.example.yaml", "modules/requirements.txt"])
             repo.index.commit(f"chore(cellophane): Updated '{module_}->{version}'")
             logger.info(f"Updated '{module_}->{version}'")
 
@@ -252,9 +256,7 @@ def rm(
             logger.error(f"Unable to remove '{module_}': {exc!r}", exc_info=True)
             repo.head.reset("HEAD", index=True, working_tree=True)
         else:
-            repo.index.add("config.example.yaml")
-            repo.index.add("modules/requirements.txt")
-            repo.index.write()
+            repo.index.add(["config.example.yaml", "modules/requirements.txt"])
             repo.index.commit(f"feat(cellophane): Removed '{module_}'")
             logger.info(f"Removed '{module_}'")
 
@@ -1,9 +1,10 @@
 """Utility functions for cellophane dev command-line interface."""
 
+import os
 import re
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, Iterable, Sequence
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from git import GitCommandError, Remote, Repo
 from questionary import Choice, checkbox, select
@@ -19,6 +20,14 @@ from .exceptions import (
 )
 from .repo import ProjectRepo
 
+_NON_WORD = re.compile(r"\W")
+
+
+@lru_cache(maxsize=32)
+def _template(name: str) -> str:
+    """Read a project template shipped with cellophane."""
+    return (CELLOPHANE_ROOT / "template" / name).read_text(encoding="utf-8")
+
 
 def add_requirements(path: Path, _module: str) -> None:
     """Add module requirements to the global requirements file.
@@ -30,16 +39,18 @@ def add_requirements(path: Path, _module: str) -> None:
 
     """
     requirements_path = path / "modules" / "requirements.txt"
-    module_path = path / "modules" / _module
 
-    if (
-        module_path.is_dir()
-        and (module_path / "requirements.txt").exists()
-        and (spec := f"-r {_module}/requirements.txt\n")
-        not in requirements_path.read_text()
-    ):
-        with open(requirements_path, "a", encoding="utf-8") as handle:
-            handle.write(spec)
+    if not os.path.isfile(path / "modules" / _module / "requirements.txt"):
+        return
+
+    spec = f"-r {_module}/requirements.txt"
+    with open(requirements_path, "r+", encoding="utf-8") as handle:
+        lines = handle.read().splitlines(keepends=True)
+        if spec not in {line.rstrip("\r\n") for line in lines}:
+            # Keep the new spec on its own line if the file lacks a final newline
+            if lines and not lines[-1].endswith("\n"):
+                handle.write("\n")
+            handle.write(f"{spec}\n")
 
 
 def remove_requirements(path: Path, _module: str) -> None:
@@ -52,12 +63,49 @@ def remove_requirements(path: Path, _module: str) -> None:
 
     """
     requirements_path = path / "modules" / "requirements.txt"
+    tmp_path = requirements_path.with_suffix(".txt.tmp")
+    spec = f"-r {_module}/requirements.txt"
 
-    if (spec := f"-r {_module}/requirements.txt\n") in (
-        requirements := requirements_path.read_text()
-    ):
-        with open(requirements_path, "w", encoding="utf-8") as handle:
-            handle.write(requirements.replace(spec, ""))
+    with open(requirements_path, encoding="utf-8") as handle:
+        lines = handle.readlines()
+
+    kept = [line for line in lines if line.rstrip("\r\n") != spec]
+    if len(kept) == len(lines):
+        return
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.writelines(kept)
+        os.replace(tmp_path, requirements_path)
+    finally:
+        # Only left behind if writing or replacing failed
+        tmp_path.unlink(missing_ok=True)
+
+
+def _iter_module_schemas(modules_dir: str) -> Iterator[str]:
+    """Yield paths to all schema.yaml files below a modules directory.
+
+    Directories are visited depth-first in the same order as
+    `Path.glob("**/schema.yaml")`, but symlinked directories are not followed.
+
+    Args:
+    ----
+      modules_dir (str): The directory to search.
+
+    """
+    subdirs: list[str] = []
+    try:
+        with os.scandir(modules_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name == "schema.yaml" and entry.is_file():
+                    yield entry.path
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    for subdir in subdirs:
+        yield from _iter_module_schemas(subdir)
 
 
 def update_example_config(path: Path) -> None:
@@ -72,7 +120,7 @@ def update_example_config(path: Path) -> None:
         path=[
             CELLOPHANE_ROOT / "schema.base.yaml",
             path / "schema.yaml",
-            *(path / "modules").glob("**/schema.yaml"),
+            *map(Path, _iter_module_schemas(os.path.join(path, "modules"))),
         ],
     )
 
@@ -146,12 +194,13 @@ def with_modules(ignore_branch: bool = False) -> Callable:
             if invalid_modules := {m for m, _ in modules or []} - set(valid_modules):
                 raise InvalidModuleError(invalid_modules.pop())
 
+            external_modules = repo.external.modules
             if invalid_versions := {
                 (m, v)
                 for m, v in modules or []
                 if v is not None
                 and v != "latest"
-                and v not in repo.external.modules[m]["versions"]
+                and v not in external_modules[m]["versions"]
             }:
                 raise InvalidVersionError(*invalid_versions.pop())
 
@@ -172,13 +221,13 @@ def with_modules(ignore_branch: bool = False) -> Callable:
                     case (m, None, None):
                         modules_[idx] = ask_version(m, repo.compatible_versions(m))  # type: ignore[assignment]
                     case (m, None, "latest"):
-                        version = repo.external.modules[m].get("latest")
+                        version = external_modules[m].get("latest")
                         if version is None:
                             raise InvalidVersionError(m, "latest")
-                        tag = repo.external.modules[m]["versions"][version]["tag"]
+                        tag = external_modules[m]["versions"][version]["tag"]
                         modules_[idx] = (m, tag, version)
                     case (m, None, v):
-                        tag = repo.external.modules[m]["versions"][v]["tag"]
+                        tag = external_modules[m]["versions"][v]["tag"]
                         modules_[idx] = (m, tag, v)
 
             return func(repo, modules_, **kwargs)
@@ -257,9 +306,15 @@ def initialize_project(
         ```
 
     """
-    _prog_name = re.sub("\\W", "_", name)
+    _prog_name = _NON_WORD.sub("_", name)
+
+    try:
+        with os.scandir(path) as entries:
+            not_empty = next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        not_empty = False
 
-    if [*path.glob("*")] and not force:
+    if not_empty and not force:
         raise FileExistsError(path)
 
     for subdir in (
@@ -268,41 +323,27 @@ def initialize_project(
     ):
         subdir.mkdir(parents=True, exist_ok=force)
 
-    for file in (
+    touched = (
         path / "modules" / "__init__.py",
         path / "schema.yaml",
-    ):
-        file.touch(exist_ok=force)
-
-    (path / "__main__.py").write_text(
-        (CELLOPHANE_ROOT / "template" / "__main__.py")
-        .read_text(encoding="utf-8")
-        .format(label=name, prog_name=_prog_name),
-    )
-
-    (path / f"{_prog_name}.py").write_text(
-        (CELLOPHANE_ROOT / "template" / "entrypoint.py")
-        .read_text(encoding="utf-8")
-        .format(label=name, prog_name=_prog_name),
-    )
-
-    (path / "requirements.txt").write_text(
-        (CELLOPHANE_ROOT / "template" / "requirements.txt")
-        .read_text(encoding="utf-8")
-        .format(label=name, prog_name=_prog_name),
-    )
-
-    (path / ".gitignore").write_text(
-        (CELLOPHANE_ROOT / "template" / ".gitignore")
-        .read_text(encoding="utf-8")
-        .format(label=name, prog_name=_prog_name),
     )
+    for file in touched:
+        file.touch(exist_ok=force)
 
-    (path / "modules" / "requirements.txt").write_text(
-        (CELLOPHANE_ROOT / "template" / "modules" / "requirements.txt")
-        .read_text(encoding="utf-8")
-        .format(label=name, prog_name=_prog_name),
-    )
+    template_kwargs = {"label": name, "prog_name": _prog_name}
+    rendered = [
+        (target, _template(template).format(**template_kwargs))
+        for target, template in (
+            (path / "__main__.py", "__main__.py"),
+            (path / f"{_prog_name}.py", "entrypoint.py"),
+            (path / "requirements.txt", "requirements.txt"),
+            (path / ".gitignore", ".gitignore"),
+            (path / "modules" / "requirements.txt", "modules/requirements.txt"),
+        )
+    ]
+
+    for target, content in rendered:
+        target.write_text(content, encoding="utf-8")
 
     update_example_config(path)
 
@@ -310,17 +351,11 @@ def initialize_project(
 
     repo.index.add(
         [
-            path / "modules" / "__init__.py",
-            path / "modules" / "requirements.txt",
-            path / "requirements.txt",
-            path / "schema.yaml",
-            path / "config.example.yaml",
-            path / "__main__.py",
-            path / f"{_prog_name}.py",
-            path / ".gitignore",
+            *(str(file) for file in touched),
+            *(str(target) for target, _ in rendered),
+            str(path / "config.example.yaml"),
         ],
     )
-    repo.index.write()
     repo.index.commit("feat(cellophane): Initial commit from cellophane 🎉")
 
     return ProjectRepo(path, modules_repo_url, modules_repo_branch)
@@ -6,7 +6,8 @@ import os
 import shlex
 import sys
 from contextlib import suppress
-from functools import partial
+from functools import lru_cache, partial
+from itertools import chain
 from multiprocessing.synchronize import Lock
 from pathlib import Path
 from time import sleep
@@ -26,6 +27,11 @@ _POOLS: dict[UUID, WorkerPool] = {}
 _ROOT = Path(__file__).parent
 
 
+@lru_cache(maxsize=4096)
+def _split(arg: str) -> tuple[str, ...]:
+    return tuple(shlex.split(arg))
+
+
 class ExecutorTerminatedError(Exception):
     """Exception raised when trying to access a terminated executor."""
 
@@ -90,10 +96,12 @@ class Executor:
         """Callback function for the executor."""
         logger.debug(msg)
         try:
-            (fn or (lambda _: ...))(result)
+            if fn is not None:
+                fn(result)
         except Exception as exc:  # pylint: disable=broad-except
             logger.error(f"Callback failed: {exc!r}")
-        lock.release()
+        finally:
+            lock.release()
 
     def _target(
         self,
@@ -110,7 +118,10 @@ class Executor:
         conda_spec: dict | None,
     ) -> None:
         """Target function for the executor."""
-        sys.stdout = sys.stderr = open(os.devnull, "w", encoding="utf-8")
+        if getattr(sys.stdout, "name", None) != os.devnull:
+            # Later jobs in the same worker reuse the handle opened by the first
+            # pylint: disable-next=consider-using-with
+            sys.stdout = sys.stderr = open(os.devnull, "w", encoding="utf-8")
         logs.redirect_logging_to_queue(log_queue)
         logs.handle_warnings()
         logger = logging.LoggerAdapter(logging.getLogger(), {"label": name})
@@ -118,8 +129,8 @@ class Executor:
         workdir_ = workdir or config.workdir / uuid.hex
         workdir_.mkdir(parents=True, exist_ok=True)
 
-        env_ = env or {}
-        args_ = tuple(word for arg in args for word in shlex.split(str(arg)))
+        env_ = {**env}
+        args_ = tuple(chain.from_iterable(_split(str(arg)) for arg in args))
         if conda_spec:
             yaml = YAML(typ="safe")
             (workdir_ / "conda").mkdir(parents=True, exist_ok=True)
@@ -137,7 +148,7 @@ class Executor:
                 name=name,
                 uuid=uuid,
                 workdir=workdir_,
-                env={k: str(v) for k, v in env_.items()},
+                env=env_,
                 os_env=os_env,
                 cpus=cpus or config.executor.cpus,
                 memory=memory or config.executor.memory,
@@ -264,7 +275,7 @@ class Executor:
                 "name": _name,
                 "config": self.config,
                 "workdir": workdir,
-                "env": env,
+                "env": {k: str(v) for k, v in (env or {}).items()},
                 "os_env": os_env,
                 "cpus": cpus,
                 "memory": memory,
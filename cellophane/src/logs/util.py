@@ -2,14 +2,14 @@
 
 import inspect
 import logging
+import os
 import warnings
-from functools import cache
 from logging.handlers import QueueHandler, QueueListener
 from multiprocessing import Queue
 from pathlib import Path
 from typing import Any, Callable
 
-from attrs import define
+from attrs import define, field
 from rich.logging import RichHandler
 
 
@@ -18,14 +18,18 @@ class ExternalFilter(logging.Filter):
     """Filter for log records coming from external libraries."""
 
     internal_roots: tuple[Path, ...]
+    _prefixes: tuple[str, ...] = field(init=False, repr=False, eq=False)
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        return self._check_relative(Path(record.pathname), self.internal_roots)
+    def __attrs_post_init__(self) -> None:
+        # Trailing separator so that eg. /a/b does not match /a/bc
+        self._prefixes = tuple(
+            os.path.join(os.path.abspath(r), "") for r in self.internal_roots
+        )
 
-    @staticmethod
-    @cache
-    def _check_relative(path: Path, roots: tuple[Path, ...]) -> bool:
-        return any(path.is_relative_to(r) for r in roots)
+    def filter(self, record: logging.LogRecord) -> bool:
+        # NOTE: Do not memoize this per path name. Long running pipelines log
+        # from an unbounded number of paths, and the check is a single C call.
+        return record.pathname.startswith(self._prefixes)
 
 
 def _showwarning(showwarning_orig: Callable) -> Callable:
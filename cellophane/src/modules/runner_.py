@@ -129,14 +129,14 @@ class Runner:
                 cleanup(reason=f"Unhandeled exception in runner '{self.name}' {exc!r}")
 
         _resolve_outputs(samples, workdir, config, logger)
-        for sample in samples.complete:
+        for sample in samples.iter_complete():
             logger.debug(f"Sample {sample.id} processed successfully")
         for sample in samples.unprocessed:
             sample.fail("Sample was not processed")
-        if n_failed := len(samples.failed):
-            logger.error(f"{n_failed} samples failed")
+        if failed := [*samples.iter_failed()]:
+            logger.error(f"{len(failed)} samples failed")
             cleaner.unregister(workdir)
-        for sample in samples.failed:
+        for sample in failed:
             logger.debug(f"Sample {sample.id} failed - {sample.failed}")
 
         return samples, cleaner
@@ -148,15 +148,16 @@ def _resolve_outputs(
     config: Config,
     logger: LoggerAdapter,
 ) -> None:
+    complete = samples.complete
     for output_ in samples.output.copy():
         if not isinstance(output_, OutputGlob):
             continue
         samples.output.remove(output_)
-        if not samples.complete:
+        if not complete:
             continue
         try:
             samples.output |= output_.resolve(
-                samples=samples.complete,
+                samples=complete,
                 workdir=workdir,
                 config=config,
             )
@@ -148,6 +148,14 @@ class Test_TypedArray:
             _array = cfg.click_.TypedArray(item_type)  # type: ignore[arg-type]
             _array.convert(value, None, None)  # type: ignore[arg-type]
 
+    @staticmethod
+    def test_convert_bounds() -> None:
+        """Test TypedArray.convert with item bounds."""
+        _array = cfg.click_.TypedArray("integer", items_min=1, items_max=3)
+        assert _array.convert(["1", "3"], None, None) == [1, 3]
+        with raises(click.BadParameter):
+            _array.convert(["4"], None, None)
+
 
 class Test_ParsedSize:
     """Test ParsedSize."""
@@ -186,6 +194,16 @@ class Test_ParsedSize:
                 1337 * 1024,
                 id="str_KiB",
             ),
+            param(
+                "1.5 G",
+                1_500_000_000,
+                id="str_float_G",
+            ),
+            param(
+                "2 kilobytes",
+                2000,
+                id="str_fallback",
+            ),
         ],
     )
     def test_convert(
@@ -217,6 +235,23 @@ class Test_ParsedSize:
             _array.convert(value, None, None)
 
 
+class Test_FormattedString:
+    """Test FormattedString."""
+
+    @staticmethod
+    def test_convert_pattern() -> None:
+        """Test FormattedString.convert with valid and unsupported patterns."""
+        _string = FormattedString(pattern="^a+$")
+        assert _string.convert("aaa", None, None) == "aaa"
+        with raises(click.BadParameter):
+            _string.convert("b", None, None)
+
+        # ECMA-only syntax must not fail until a value is converted
+        _unsupported = FormattedString(pattern="\\p{L}")
+        with raises(click.BadParameter):
+            _unsupported.convert("a", None, None)
+
+
 class Test_Flag:
     """Test cfg._click.Flag."""
 
@@ -329,6 +364,25 @@ class Test_Flag:
 
         assert _click_info == _flag_info
 
+    @staticmethod
+    def test_click_type_cache() -> None:
+        """Test that cfg.Flag.click_type is rebuilt when its inputs change."""
+        _flag = cfg.Flag(key=("a",), type="integer")
+        _click_type = _flag.click_type
+        assert _flag.click_type is _click_type
+        _flag.description = "DUMMY"
+        assert _flag.click_type is _click_type
+        _flag.min = 1
+        assert isinstance(_flag.click_type, click.IntRange)
+
+    @staticmethod
+    def test_flag_names_cache() -> None:
+        """Test that cfg.Flag flag names follow changes to the key."""
+        _flag = cfg.Flag(key=("a", "b"), type="boolean")
+        assert (_flag.flag, _flag.no_flag) == ("a_b", "a_no_b")
+        _flag.key = ("c",)  # type: ignore[assignment]
+        assert (_flag.flag, _flag.no_flag) == ("c", "no_c")
+
 
 class Test_Schema:
     """Test cfg.Schema."""
@@ -393,6 +447,16 @@ class Test_Schema:
         _schema = cfg.Schema(_definition["schema"])
         assert _schema.example_config == _definition["example"]
 
+    @staticmethod
+    def test_flags() -> None:
+        """Test cfg.Schema.flags."""
+        _definition = _YAML.load(
+            (LIB / "schema" / "flags" / "default.yaml").read_text(),
+        )
+        _schema = cfg.Schema(_definition["schema"])
+        assert _schema.flags == cfg.get_flags(_schema)
+        assert _schema.flags is _schema.flags
+
 
 class Test__get_flags:
     """Test cfg._get_flags."""
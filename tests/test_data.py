@@ -6,10 +6,10 @@ from pathlib import Path
 from typing import ClassVar
 
 import dill
-from attrs import define, field
+from attrs import define, evolve, field
 from pytest import FixtureRequest, MonkeyPatch, fixture, mark, param, raises
 
-from cellophane.src import data
+from cellophane.src import data, util
 
 LIB = Path(__file__).parent / "lib"
 
@@ -92,6 +92,13 @@ class Test_Container:
         _container.c = 1339
         assert data.as_dict(_container) == {"a": {"b": 1337, "f": 1338}, "c": 1339}
 
+    @staticmethod
+    def test_freeze() -> None:
+        """Test freezing a container."""
+        _container = data.Container(a={"b": [1337]}, c=1338)
+        assert util.freeze(_container) == util.freeze(data.as_dict(_container))
+        assert hash(util.freeze(_container))
+
     @staticmethod
     def test_contains() -> None:
         """Test __contains__."""
@@ -242,10 +249,18 @@ class Test_Samples:
         assert samples
 
     @staticmethod
-    def test_from_file(samples: data.Samples[data.Sample]) -> None:
+    @mark.parametrize(
+        "path",
+        [
+            param(LIB / "config" / "samples.yaml", id="yaml"),
+            param(LIB / "config" / "samples.json", id="json"),
+        ],
+    )
+    def test_from_file(samples: data.Samples[data.Sample], path: Path) -> None:
         """Test from_file."""
-        _samples = data.Samples.from_file(LIB / "config" / "samples.yaml")
+        _samples = data.Samples.from_file(path)
         assert not {s.id for s in _samples} - {s.id for s in samples}
+        assert [s.files for s in _samples] == [s.files for s in samples]
 
     @staticmethod
     @mark.parametrize(
@@ -288,6 +303,8 @@ class Test_Samples:
 
         samples[1].fail("DUMMY")
         assert samples[1] in samples.failed
+        assert [*samples.iter_failed()] == [samples[1]]
+        assert [*samples.iter_complete()] == [samples[0], samples[2]]
 
     @staticmethod
     def test_with_files(
@@ -396,6 +413,47 @@ class Test_Samples:
         assert sample_a.uuid in samples
         assert sample_b.uuid in samples
 
+    @staticmethod
+    def test_uuid_lookup_after_mutation() -> None:
+        """Test UUID lookups after the list has been modified."""
+        sample_a = data.Sample(id="a", files=["a", "b"])
+        sample_b = data.Sample(id="b", files=["c", "d"])
+        sample_c = data.Sample(id="c", files=["e", "f"])
+        samples: data.Samples = data.Samples([sample_a, sample_b])
+
+        samples.remove(sample_a)
+        assert sample_a.uuid not in samples
+        assert samples[sample_b.uuid] == sample_b
+
+        samples.insert(0, sample_c)
+        assert samples[sample_c.uuid] == sample_c
+        assert samples[sample_b.uuid] == sample_b
+
+        samples.data.reverse()
+        assert samples[sample_c.uuid] == sample_c
+
+        samples.data = [sample_a]
+        assert sample_a.uuid in samples
+        assert sample_b.uuid not in samples
+
+    @staticmethod
+    def test_uuid_lookup_after_item_assignment() -> None:
+        """Test UUID lookups after an in-place write to data."""
+        sample_a = data.Sample(id="a", files=["a", "b"])
+        sample_b = data.Sample(id="b", files=["c", "d"])
+        sample_c = data.Sample(id="c", files=["e", "f"])
+        samples: data.Samples = data.Samples([sample_a, sample_b])
+        assert sample_a.uuid in samples
+
+        samples.data[0] = sample_c
+        assert sample_c.uuid in samples
+        assert sample_a.uuid not in samples
+        assert samples[sample_c.uuid] == sample_c
+
+        samples[sample_c.uuid] = sample_c
+        assert len(samples) == 2
+        assert len(samples | data.Samples([sample_c])) == 2
+
     @staticmethod
     def test_and() -> None:
         """Test __and__."""
@@ -493,11 +551,14 @@ class Test_OutputGlob:
         request: FixtureRequest,
     ) -> set[data.Output]:
         """Append tmp_path to expected outputs."""
-        outputs = request.param
-        for output in outputs:
-            output.src = Path(str(output.src).format(**meta))
-            output.dst = Path(str(output.dst).format(**meta))
-        return {*outputs}
+        return {
+            evolve(
+                output,
+                src=Path(str(output.src).format(**meta)),
+                dst=Path(str(output.dst).format(**meta)),
+            )
+            for output in request.param
+        }
 
     @fixture(scope="function")
     @staticmethod
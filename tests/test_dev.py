@@ -169,6 +169,65 @@ class Test_update_example_config:
 
         assert (tmp_path / "config.example.yaml").exists()
 
+    def test_iter_module_schemas(self, tmp_path: Path) -> None:
+        """Test finding module schemas."""
+        (tmp_path / "modules" / "a" / "sub").mkdir(parents=True)
+        (tmp_path / "modules" / "b").mkdir()
+        (tmp_path / "modules" / "a" / "schema.yaml").touch()
+        (tmp_path / "modules" / "a" / "sub" / "schema.yaml").touch()
+        (tmp_path / "modules" / "b" / "other.yaml").touch()
+        (tmp_path / "modules" / "link").symlink_to(tmp_path / "modules" / "a")
+
+        assert sorted(
+            dev.util._iter_module_schemas(str(tmp_path / "modules"))
+        ) == sorted(
+            str(p) for p in (tmp_path / "modules" / "a").glob("**/schema.yaml")
+        )
+        assert [*dev.util._iter_module_schemas(str(tmp_path / "missing"))] == []
+
+
+class Test_requirements:
+    """Test adding and removing module requirements."""
+
+    @staticmethod
+    def test_add_requirements(tmp_path: Path) -> None:
+        """Test adding module requirements."""
+        for module_ in ("a", "b"):
+            (tmp_path / "modules" / module_).mkdir(parents=True)
+            (tmp_path / "modules" / module_ / "requirements.txt").touch()
+        requirements = tmp_path / "modules" / "requirements.txt"
+        requirements.write_text("-r a/requirements.txt")
+
+        dev.add_requirements(tmp_path, "a")
+        dev.add_requirements(tmp_path, "b")
+        dev.add_requirements(tmp_path, "b")
+        dev.add_requirements(tmp_path, "missing")
+
+        assert requirements.read_text() == (
+            "-r a/requirements.txt\n-r b/requirements.txt\n"
+        )
+
+    @staticmethod
+    def test_remove_requirements(tmp_path: Path) -> None:
+        """Test removing module requirements."""
+        (tmp_path / "modules").mkdir()
+        requirements = tmp_path / "modules" / "requirements.txt"
+        requirements.write_text(
+            "-r a/requirements.txt\n-r ba/requirements.txt\n-r b/requirements.txt"
+        )
+
+        dev.remove_requirements(tmp_path, "b")
+        inode = requirements.stat().st_ino
+        dev.remove_requirements(tmp_path, "missing")
+
+        # Not rewritten when the spec is absent
+        assert requirements.stat().st_ino == inode
+
+        assert requirements.read_text() == (
+            "-r a/requirements.txt\n-r ba/requirements.txt\n"
+        )
+        assert [*(tmp_path / "modules").iterdir()] == [requirements]
+
 
 class Test_ask_modules_branch:
     """Test asking for modules and branches."""
@@ -27,3 +27,16 @@ class Test_logs:
             for _handler in logger.logger.handlers
         )
         assert "TEST" in _path.read_text()
+
+    @staticmethod
+    def test_external_filter(tmp_path: Path) -> None:
+        """Test ExternalFilter."""
+        _filter = logs.ExternalFilter((tmp_path / "a",))
+
+        def _record(path: Path) -> logging.LogRecord:
+            return logging.makeLogRecord({"pathname": str(path)})
+
+        assert _filter.filter(_record(tmp_path / "a" / "b.py"))
+        assert _filter.filter(_record(tmp_path / "a" / "b" / "c.py"))
+        assert not _filter.filter(_record(tmp_path / "ab.py"))
+        assert not _filter.filter(_record(tmp_path / "ab" / "c.py"))